@@ -0,0 +1,100 @@
+"""Benchmark cold start dashboard per halaman.
+
+Setiap pengukuran berjalan di proses Python baru sehingga import dan cache
+Streamlit benar-benar dingin:
+
+- import_s       : waktu import modul halaman (setelah streamlit ter-import)
+- first_render_s : waktu render pertama app.py langsung di halaman tersebut
+
+Jalankan: python bench_startup.py [--repeat N]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+# Library berat dan modul repo yang di-load per halaman
+HEAVY_MODULES = ["pandas", "numpy", "pyarrow", "plotly.express", "binning", "ingest", "partition", "route"]
+
+
+def _child_import(label):
+    start = time.perf_counter()
+    import streamlit  # noqa: F401
+    streamlit_s = time.perf_counter() - start
+
+    from views import load_page
+    start = time.perf_counter()
+    load_page(label)
+    import_s = time.perf_counter() - start
+    return {
+        "streamlit_s": streamlit_s,
+        "import_s": import_s,
+        "heavy": [name for name in HEAVY_MODULES if name in sys.modules],
+    }
+
+
+def _child_render(label):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=120)
+    at.session_state["page"] = label
+    start = time.perf_counter()
+    at.run()
+    first_render_s = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(f"{label}: {at.exception[0].message}")
+    return {"first_render_s": first_render_s}
+
+
+def _run_child(mode, label):
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", mode, label],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    # Streamlit bisa menulis log ke stdout; hasil ada di baris terakhir
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run_benchmark(repeat=3):
+    from views import PAGES
+
+    rows = []
+    for label in PAGES:
+        imports = [_run_child("import", label) for _ in range(repeat)]
+        renders = [_run_child("render", label) for _ in range(repeat)]
+        rows.append({
+            "page": label,
+            "streamlit_s": statistics.median(r["streamlit_s"] for r in imports),
+            "import_s": statistics.median(r["import_s"] for r in imports),
+            "first_render_s": statistics.median(r["first_render_s"] for r in renders),
+            "heavy": ", ".join(imports[0]["heavy"]) or "-",
+        })
+    return rows
+
+
+def print_report(rows, repeat):
+    print(f"🚀 Cold start per halaman (median dari {repeat} proses baru)\n")
+    print(f"{'Halaman':<22} {'import streamlit':>17} {'import halaman':>15} {'render pertama':>15}  modul ter-load")
+    for row in rows:
+        print(f"{row['page']:<22} {row['streamlit_s']:>16.3f}s {row['import_s']:>14.3f}s "
+              f"{row['first_render_s']:>14.3f}s  {row['heavy']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark cold start dashboard per halaman")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "PAGE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        mode, label = args.child
+        sys.path.insert(0, ROOT)
+        result = _child_import(label) if mode == "import" else _child_render(label)
+        print(json.dumps(result))
+    else:
+        sys.path.insert(0, ROOT)
+        print_report(run_benchmark(args.repeat), args.repeat)
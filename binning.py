@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+
+OTHER_LABEL = "Lainnya"
+
+
+def histogram_bins(values, bins=20, value_range=None):
+    """Hitung bin histogram di server; ukuran hasil selalu `bins` baris.
+
+    Mengembalikan DataFrame bin_start, bin_end, bin_mid, count yang bisa
+    langsung digambar sebagai bar chart tanpa mengirim nilai mentah.
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    counts, edges = np.histogram(values, bins=bins, range=value_range)
+    return pd.DataFrame({
+        'bin_start': edges[:-1],
+        'bin_end': edges[1:],
+        'bin_mid': (edges[:-1] + edges[1:]) / 2,
+        'count': counts,
+    })
+
+
+def top_n_with_other(counts, n=10, other_label=OTHER_LABEL):
+    """Ambil n kategori terbesar dan gabungkan sisanya ke satu bucket"""
+    counts = counts.sort_values(ascending=False)
+    if len(counts) <= n:
+        return counts
+    other = pd.Series([counts.iloc[n:].sum()], index=[other_label])
+    return pd.concat([counts.iloc[:n], other]).rename(counts.name)
@@ -1,8 +1,20 @@
 import pandas as pd
 from sqlalchemy import create_engine, inspect
+import argparse
 import os
 
-def run_etl():
+from partition import PARTITION_DIR, write_partitioned
+
+def write_partitioned_dataset(tourism_df, root=PARTITION_DIR):
+    """Tulis tourism_with_id sebagai dataset terpartisi City/Category.
+
+    Rating tidak dipartisi: dashboard membacanya dari agregat live (ingest.py).
+    """
+    print(f"📦 Partisi: Menulis dataset terpartisi ke '{root}'...")
+    entry = write_partitioned(tourism_df, "tourism_with_id", root=root)
+    print(f"   ✅ tourism_with_id: {entry['rows']} records dalam {len(entry['partitions'])} partisi")
+
+def run_etl(partitioned_dir=None):
     print("🚀 Memulai proses ETL...")
     
     # === 1. EXTRACT ===
@@ -48,6 +60,13 @@ def run_etl():
         print(f"❌ Error transformasi data: {e}")
         return
 
+    # === 2b. PARTISI (opsional) ===
+    if partitioned_dir:
+        try:
+            write_partitioned_dataset(tourism_df, root=partitioned_dir)
+        except Exception as e:
+            print(f"❌ Error menulis dataset terpartisi: {e}")
+
     # === 3. LOAD ===
     print("📤 Load: Menyimpan ke PostgreSQL...")
     
@@ -96,4 +115,14 @@ def run_etl():
         print(f"❌ Error menyimpan ke database: {e}")
 
 if __name__ == "__main__":
-    run_etl()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="ETL data pariwisata ke PostgreSQL")
+    parser.add_argument(
+        "--partitioned",
+        nargs="?",
+        const=PARTITION_DIR,
+        default=None,
+        metavar="DIR",
+        help=f"Tulis juga dataset Parquet terpartisi City/Category (default: {PARTITION_DIR})",
+    )
+    args = parser.parse_args()
+    run_etl(partitioned_dir=args.partitioned)
@@ -0,0 +1,397 @@
+import argparse
+import io
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+# --- Lokasi default: snapshot rating dan event log append-only
+SNAPSHOT_FILE = "data/tourism_rating.csv"
+EVENT_LOG = "data/rating_events.csv"
+FIELDS = ["User_Id", "Place_Id", "Place_Ratings"]
+RATING_MIN, RATING_MAX = 1, 5
+# Event log dipadatkan ke snapshot setiap sekian event
+COMPACT_EVERY = 1000
+# Lock compaction yang lebih tua dari ini dianggap sisa proses yang mati
+COMPACT_LOCK_TIMEOUT = 60
+
+
+def append_ratings(events, path=EVENT_LOG):
+    """Tambahkan banyak rating (user_id, place_id, rating) ke event log dalam satu write dan satu fsync"""
+    if not events:
+        return
+    rows = "".join(f"{int(user_id)},{int(place_id)},{rating:g}\n" for user_id, place_id, rating in events)
+    write_header = not os.path.exists(path) or os.path.getsize(path) == 0
+    with open(path, "a", encoding="utf-8") as f:
+        if write_header:
+            rows = ",".join(FIELDS) + "\n" + rows
+        f.write(rows)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def append_rating(user_id, place_id, rating, path=EVENT_LOG):
+    """Tambahkan satu rating ke event log (satu baris CSV, langsung di-flush)"""
+    append_ratings([(user_id, place_id, rating)], path)
+
+
+def _read_complete_lines(f, offset):
+    f.seek(offset)
+    chunk = f.read()
+    end = chunk.rfind(b"\n") + 1
+    return chunk[:end].decode("utf-8").splitlines(), offset + end
+
+
+def read_new_lines(path, offset):
+    """Baris lengkap sejak offset byte; baris terakhir yang belum selesai ditunda"""
+    with open(path, "rb") as f:
+        return _read_complete_lines(f, offset)
+
+
+def _parse_line(line):
+    """Parse satu baris event; None untuk header atau baris rusak"""
+    parts = line.strip().split(",")
+    if len(parts) != len(FIELDS):
+        return None
+    try:
+        user_id, place_id, rating = int(parts[0]), int(parts[1]), float(parts[2])
+    except ValueError:
+        return None
+    if not RATING_MIN <= rating <= RATING_MAX:
+        return None
+    return user_id, place_id, rating
+
+
+class RatingAggregates:
+    """Count/sum/histogram rating per tempat yang diperbarui O(1) per event"""
+
+    def __init__(self):
+        self.count = {}
+        self.total = {}
+        self.hist = {}
+        self.total_count = 0
+
+    def add(self, place_id, rating):
+        if place_id not in self.count:
+            self.count[place_id] = 0
+            self.total[place_id] = 0.0
+            self.hist[place_id] = [0] * (RATING_MAX - RATING_MIN + 1)
+        self.count[place_id] += 1
+        self.total[place_id] += rating
+        self.hist[place_id][int(round(rating)) - RATING_MIN] += 1
+        self.total_count += 1
+
+    def add_frame(self, df):
+        """Bootstrap dari snapshot secara vektor (sekali saat start)"""
+        df = df[df['Place_Ratings'].between(RATING_MIN, RATING_MAX)]
+        buckets = df['Place_Ratings'].round().astype(int)
+        hist = pd.crosstab(df['Place_Id'], buckets).reindex(
+            columns=range(RATING_MIN, RATING_MAX + 1), fill_value=0
+        )
+        grouped = df.groupby('Place_Id')['Place_Ratings'].agg(['count', 'sum'])
+        for place_id, n, total in zip(grouped.index, grouped['count'], grouped['sum']):
+            place_id = int(place_id)
+            if place_id not in self.count:
+                self.count[place_id] = 0
+                self.total[place_id] = 0.0
+                self.hist[place_id] = [0] * (RATING_MAX - RATING_MIN + 1)
+            self.count[place_id] += int(n)
+            self.total[place_id] += float(total)
+            self.hist[place_id] = [a + int(b) for a, b in zip(self.hist[place_id], hist.loc[place_id])]
+        self.total_count += len(df)
+
+    def place_stats(self):
+        """DataFrame Place_Id, Rating_Count, Rating_Sum, Place_Ratings (mean), Hist_1..Hist_5"""
+        place_ids = np.fromiter(self.count.keys(), dtype=int, count=len(self.count))
+        counts = np.fromiter(self.count.values(), dtype=int, count=len(self.count))
+        sums = np.fromiter(self.total.values(), dtype=float, count=len(self.total))
+        stats = pd.DataFrame({
+            'Place_Id': place_ids,
+            'Rating_Count': counts,
+            'Rating_Sum': sums,
+            'Place_Ratings': sums / np.maximum(counts, 1),
+        })
+        hist = np.array(list(self.hist.values()), dtype=int).reshape(-1, RATING_MAX - RATING_MIN + 1)
+        for i, bucket in enumerate(range(RATING_MIN, RATING_MAX + 1)):
+            stats[f'Hist_{bucket}'] = hist[:, i]
+        return stats
+
+
+class RatingStream:
+    """Agregat rating live: snapshot CSV + tail event log + compaction berkala.
+
+    Aman dipakai bersama antar sesi Streamlit (st.cache_resource); semua akses
+    ke state dilindungi lock. Snapshot dan event log dibaca sebagai satu urutan
+    event: compaction (oleh proses ini atau proses lain, misal
+    `python ingest.py compact`) hanya memindahkan baris log ke akhir snapshot.
+    Karena itu snapshot yang bertambah berarti log sudah di-compact; baris yang
+    sudah terbaca dari log dilewati, sisanya ikut dihitung.
+    """
+
+    def __init__(self, snapshot_path=SNAPSHOT_FILE, log_path=EVENT_LOG, compact_every=COMPACT_EVERY):
+        self.snapshot_path = snapshot_path
+        self.log_path = log_path
+        self.compact_every = compact_every
+        self.aggregates = RatingAggregates()
+        self.skipped = 0
+        self.last_update = time.time()
+        # Byte snapshot yang sudah masuk agregat
+        self._snapshot_size = 0
+        # Posisi baca dan jumlah event yang sudah dihitung dari log aktif
+        self._offset = 0
+        self._log_rows = 0
+        # Event dari log yang sudah di-compact tapi belum terlihat di snapshot
+        self._skip_snapshot = 0
+        self._pending = 0
+        self._lock = threading.Lock()
+
+        # Compaction yang terputus: selesaikan dulu sebelum membaca snapshot
+        self._recover_compaction()
+
+        if os.path.exists(snapshot_path):
+            with open(snapshot_path, "rb") as f:
+                data = f.read()
+            self._snapshot_size = len(data)
+            if data.strip():
+                self.aggregates.add_frame(pd.read_csv(io.BytesIO(data)))
+        self.poll()
+
+    @property
+    def _compacting_path(self):
+        return self.log_path + ".compacting"
+
+    @property
+    def _compaction_lock_path(self):
+        return self.log_path + ".lock"
+
+    def _acquire_compaction_lock(self):
+        """Lock file antar proses (O_EXCL, portable); False jika proses lain sedang compaction"""
+        path = self._compaction_lock_path
+        for _ in range(2):
+            try:
+                os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return True
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(path) < COMPACT_LOCK_TIMEOUT:
+                        return False
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+        return False
+
+    def _release_compaction_lock(self):
+        try:
+            os.remove(self._compaction_lock_path)
+        except FileNotFoundError:
+            pass
+
+    def _recover_compaction(self):
+        """Selesaikan compaction yang terputus (compactor mati sebelum menghapus .compacting).
+
+        Mengembalikan False jika compaction masih dipegang proses lain. Jika
+        proses mati tepat setelah append ke snapshot, event bisa tercatat dua kali.
+        """
+        if not os.path.exists(self._compacting_path):
+            return True
+        if not self._acquire_compaction_lock():
+            return False
+        try:
+            if os.path.exists(self._compacting_path):
+                self._merge_into_snapshot(self._compacting_path)
+        finally:
+            self._release_compaction_lock()
+        return True
+
+    def _add_lines(self, lines):
+        added = 0
+        for line in lines:
+            event = _parse_line(line)
+            if event is None:
+                if line.strip() and line.strip() != ",".join(FIELDS):
+                    self.skipped += 1
+                continue
+            self.aggregates.add(event[1], event[2])
+            added += 1
+        return added
+
+    def _snapshot_file_size(self):
+        return os.path.getsize(self.snapshot_path) if os.path.exists(self.snapshot_path) else 0
+
+    def _sync_snapshot(self):
+        """Hitung baris baru di snapshot; bertambahnya snapshot berarti log sudah di-compact"""
+        if self._snapshot_file_size() <= self._snapshot_size:
+            return 0
+
+        # Log yang sedang dibaca sudah dipindah ke snapshot; log berikutnya dibaca dari awal
+        self._skip_snapshot += self._log_rows
+        self._offset, self._log_rows = 0, 0
+
+        lines, self._snapshot_size = read_new_lines(self.snapshot_path, self._snapshot_size)
+        new_lines = []
+        for line in lines:
+            if _parse_line(line) is None:
+                continue
+            if self._skip_snapshot:
+                # Sudah dihitung dari event log sebelum di-compact
+                self._skip_snapshot -= 1
+                continue
+            new_lines.append(line)
+        return self._add_lines(new_lines)
+
+    def _poll_locked(self):
+        added = 0
+        # Selama compaction berjalan, urutan log baru terhadap snapshot belum pasti.
+        # Baris log yang sudah terbaca lalu ikut di-merge dilewati oleh _sync_snapshot.
+        if self._recover_compaction():
+            added = self._sync_snapshot()
+            if os.path.exists(self.log_path):
+                added += self._read_log()
+        if added:
+            self.last_update = time.time()
+        return added
+
+    def _read_log(self):
+        try:
+            f = open(self.log_path, "rb")
+        except FileNotFoundError:
+            return 0
+        with f:
+            # Compaction dimulai atau selesai sejak snapshot dicek: baca di poll berikutnya
+            if os.path.exists(self._compacting_path) or self._snapshot_file_size() != self._snapshot_size:
+                return 0
+            if os.fstat(f.fileno()).st_size < self._offset:
+                # File log dibuat ulang
+                self._offset, self._log_rows = 0, 0
+            lines, self._offset = _read_complete_lines(f, self._offset)
+        added = self._add_lines(lines)
+        self._log_rows += added
+        self._pending += added
+        return added
+
+    def poll(self):
+        """Proses event baru sejak poll terakhir; mengembalikan jumlah event baru"""
+        with self._lock:
+            added = self._poll_locked()
+            if self.compact_every and self._pending >= self.compact_every:
+                self._compact()
+            return added
+
+    def compact(self):
+        """Pindahkan isi event log ke snapshot lalu mulai log baru"""
+        with self._lock:
+            self._compact()
+
+    def _compact(self):
+        if not self._acquire_compaction_lock():
+            return
+        try:
+            if os.path.exists(self._compacting_path):
+                # Sisa compaction yang terputus; lock sudah dipegang di sini
+                self._merge_into_snapshot(self._compacting_path)
+            self._poll_locked()
+            if not os.path.exists(self.log_path):
+                return
+            # Rename dulu supaya appender berikutnya langsung menulis ke log baru
+            os.replace(self.log_path, self._compacting_path)
+            lines, _ = read_new_lines(self._compacting_path, self._offset)
+            if self._add_lines(lines):
+                self.last_update = time.time()
+            self._merge_into_snapshot(self._compacting_path)
+            # Semua baris yang baru di-merge sudah dihitung dari event log
+            self._snapshot_size = os.path.getsize(self.snapshot_path)
+            self._offset, self._log_rows, self._pending = 0, 0, 0
+        finally:
+            self._release_compaction_lock()
+
+    def _merge_into_snapshot(self, path):
+        lines, _ = read_new_lines(path, 0)
+        rows = [line.strip() for line in lines if _parse_line(line) is not None]
+        if rows:
+            write_header = not os.path.exists(self.snapshot_path) or os.path.getsize(self.snapshot_path) == 0
+            needs_newline = False
+            if not write_header:
+                with open(self.snapshot_path, "rb") as f:
+                    f.seek(-1, os.SEEK_END)
+                    needs_newline = f.read(1) != b"\n"
+            with open(self.snapshot_path, "a", encoding="utf-8") as f:
+                if write_header:
+                    f.write(",".join(FIELDS) + "\n")
+                if needs_newline:
+                    f.write("\n")
+                f.write("\n".join(rows) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        os.remove(path)
+
+    def place_stats(self):
+        with self._lock:
+            return self.aggregates.place_stats()
+
+    @property
+    def total_count(self):
+        return self.aggregates.total_count
+
+
+def copy_new_ratings(source, offset_path, log_path=EVENT_LOG):
+    """Salin baris rating baru dari CSV lain ke event log.
+
+    Offset byte terakhir disimpan di offset_path, jadi restart tidak menyalin
+    ulang baris yang sudah masuk. Mengembalikan jumlah rating yang disalin.
+    """
+    if not os.path.exists(source):
+        return 0
+    offset = 0
+    if os.path.exists(offset_path):
+        with open(offset_path, encoding="utf-8") as f:
+            offset = int(f.read().strip() or 0)
+    if os.path.getsize(source) < offset:
+        # File sumber dibuat ulang, mulai dari awal
+        offset = 0
+
+    lines, new_offset = read_new_lines(source, offset)
+    events = [event for event in map(_parse_line, lines) if event is not None]
+    append_ratings(events, log_path)
+
+    if new_offset != offset:
+        tmp_path = offset_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(str(new_offset))
+        os.replace(tmp_path, offset_path)
+    return len(events)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ingestion rating ke event log")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    add_cmd = sub.add_parser("add", help="Tambah satu rating")
+    add_cmd.add_argument("user_id", type=int)
+    add_cmd.add_argument("place_id", type=int)
+    add_cmd.add_argument("rating", type=int, choices=range(RATING_MIN, RATING_MAX + 1))
+
+    tail_cmd = sub.add_parser("tail", help="Salin baris baru dari CSV lain ke event log")
+    tail_cmd.add_argument("source")
+    tail_cmd.add_argument("--interval", type=float, default=1.0)
+    tail_cmd.add_argument("--offset-file", help="File posisi baca (default: <source>.offset)")
+
+    sub.add_parser("compact", help="Padatkan event log ke snapshot")
+
+    args = parser.parse_args()
+    if args.command == "add":
+        append_rating(args.user_id, args.place_id, args.rating)
+        print(f"✅ Rating {args.rating} untuk Place_Id {args.place_id} ditambahkan")
+    elif args.command == "tail":
+        offset_path = args.offset_file or args.source + ".offset"
+        print(f"👀 Memantau {args.source} (Ctrl+C untuk berhenti)...")
+        while True:
+            copied = copy_new_ratings(args.source, offset_path)
+            if copied:
+                print(f"   ✅ {copied} rating baru disalin")
+            time.sleep(args.interval)
+    elif args.command == "compact":
+        stream = RatingStream(compact_every=0)
+        stream.compact()
+        print(f"✅ Snapshot diperbarui: {stream.total_count} rating")
@@ -0,0 +1,2 @@
+# Loader data per area. Modul tidak di-re-export di sini supaya halaman hanya
+# meng-import area yang dipakainya (misal Data Viewer cukup loaders.tables).
@@ -0,0 +1,67 @@
+import pandas as pd
+import streamlit as st
+
+from loaders.tables import load_table, require_tables
+from partition import partition_values, read_manifest, read_partitioned
+
+def _filter_city_category(df, city=None, category=None):
+    if city is not None:
+        df = df[df['City'] == city]
+    if category is not None:
+        df = df[df['Category'] == category]
+    return df.reset_index(drop=True)
+
+def _places_entry():
+    """Entri manifest tourism_with_id; None jika dataset terpartisi belum dibuat"""
+    manifest = read_manifest()
+    if manifest is None:
+        return None
+    return manifest["tables"].get("tourism_with_id")
+
+# --- Load data terfilter: hanya partisi City/Category yang dipilih yang dibaca.
+# Versi manifest ikut jadi key cache, jadi rebuild `etl.py --partitioned` langsung terlihat.
+@st.cache_data
+def _load_places(city, category, version):
+    df = read_partitioned("tourism_with_id", city=city, category=category)
+    if df is None:
+        # Dataset terpartisi belum dibuat (jalankan: python etl.py --partitioned)
+        df = _filter_city_category(load_table("tourism_with_id"), city, category)
+    return df
+
+def load_places(city=None, category=None):
+    """Tempat wisata untuk City/Category tertentu (None = semua)"""
+    entry = _places_entry()
+    return _load_places(city, category, entry.get("version") if entry else None)
+
+def load_place_dimensions():
+    """Opsi Kota, opsi Kategori dan jumlah tempat per kota.
+
+    Diambil dari manifest (tanpa membaca data) jika ada; CSV hanya dibaca
+    sebagai fallback. None (dengan pesan error) jika CSV gagal dibaca.
+    """
+    entry = _places_entry()
+    if entry is None:
+        tables = require_tables("tourism_with_id")
+        if tables is None:
+            return None
+        tourism_df = tables[0]
+        return (sorted(tourism_df['City'].unique()), sorted(tourism_df['Category'].unique()),
+                tourism_df['City'].value_counts())
+
+    city_counts = {}
+    for part in entry["partitions"]:
+        city = part["values"]["City"]
+        city_counts[city] = city_counts.get(city, 0) + part["rows"]
+    return (partition_values(entry, "City"), partition_values(entry, "Category"),
+            pd.Series(city_counts, name="count").sort_values(ascending=False))
+
+def count_places(city=None, category=None):
+    """Jumlah tempat wisata dari row count manifest, tanpa membaca data"""
+    entry = _places_entry()
+    if entry is None:
+        return len(load_places(city, category))
+    return sum(
+        part["rows"] for part in entry["partitions"]
+        if (city is None or part["values"]["City"] == city)
+        and (category is None or part["values"]["Category"] == category)
+    )
@@ -0,0 +1,73 @@
+import time
+
+import pandas as pd
+import streamlit as st
+
+from binning import histogram_bins
+from ingest import RATING_MAX, RATING_MIN, RatingStream
+
+# Jumlah rating yang sudah ditampilkan sesi ini; stream dibagi antar sesi,
+# jadi event baru dideteksi dari total_count, bukan dari hasil poll()
+SEEN_KEY = "live_rating_seen"
+
+# --- Rating live: snapshot tourism_rating.csv + event log, dibagi antar sesi
+@st.cache_resource
+def get_rating_stream():
+    return RatingStream()
+
+def _mark_seen(state, total_count):
+    state[SEEN_KEY] = total_count
+
+def _has_unseen(state, stream):
+    """True jika stream punya rating yang belum ditampilkan di sesi ini"""
+    stream.poll()
+    seen = state.get(SEEN_KEY)
+    if seen is None:
+        _mark_seen(state, stream.total_count)
+        return False
+    return seen != stream.total_count
+
+def load_live_ratings():
+    """Agregat rating per tempat (count, mean, histogram) termasuk event terbaru"""
+    stream = get_rating_stream()
+    stream.poll()
+    # Dibaca sebelum agregat: event yang masuk di antaranya memicu satu rerun ekstra, bukan hilang
+    total_count = stream.total_count
+    stats = stream.place_stats()
+    _mark_seen(st.session_state, total_count)
+    return stats
+
+@st.cache_data(max_entries=4)
+def _rating_distributions(version):
+    stats = get_rating_stream().place_stats()
+    mean_bins = histogram_bins(stats['Place_Ratings'], bins=20, value_range=(RATING_MIN, RATING_MAX))
+    hist_cols = [f'Hist_{bucket}' for bucket in range(RATING_MIN, RATING_MAX + 1)]
+    value_counts = pd.Series(stats[hist_cols].sum().values, index=range(RATING_MIN, RATING_MAX + 1))
+    return mean_bins, value_counts
+
+def load_rating_distributions():
+    """Bin rata-rata rating per tempat dan jumlah per nilai rating.
+
+    Dihitung di server dan di-cache per versi agregat (jumlah rating), jadi
+    ukuran data chart tetap berapa pun banyaknya rating.
+    """
+    stream = get_rating_stream()
+    stream.poll()
+    total_count = stream.total_count
+    _mark_seen(st.session_state, total_count)
+    return _rating_distributions(total_count)
+
+@st.fragment(run_every=5)
+def live_rating_status():
+    """Cek event log berkala; rerun app jika ada rating yang belum ditampilkan sesi ini"""
+    stream = get_rating_stream()
+    if _has_unseen(st.session_state, stream):
+        # Ditandai sebelum rerun: fragment bisa jalan sebelum chart halaman sempat menandainya
+        _mark_seen(st.session_state, stream.total_count)
+        st.rerun()
+    last_update = time.strftime('%H:%M:%S', time.localtime(stream.last_update))
+    st.markdown(f"""
+    <div style="color: #d9e6f2; font-size: 12px; text-align: center;">
+        <p>🔴 Live: {stream.total_count} rating<br>Update terakhir {last_update}</p>
+    </div>
+    """, unsafe_allow_html=True)
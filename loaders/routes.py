@@ -0,0 +1,13 @@
+import streamlit as st
+
+from loaders.tables import load_table
+from route import build_city_matrices, solve_packages
+
+# --- Matriks jarak per kota dan urutan kunjungan paket, dihitung sekali lalu di-cache
+@st.cache_data
+def load_city_matrices():
+    return build_city_matrices(load_table("tourism_with_id"))
+
+@st.cache_data
+def load_route_plan():
+    return solve_packages(load_table("package_tourism"), load_city_matrices())
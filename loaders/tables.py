@@ -0,0 +1,39 @@
+import os
+
+import pandas as pd
+import streamlit as st
+
+# --- Lokasi CSV per tabel; setiap halaman hanya memuat tabel yang dipakainya
+TABLE_FILES = {
+    "tourism_with_id": "data/tourism_with_id.csv",
+    "tourism_rating": "data/tourism_rating.csv",
+    "users": "data/user.csv",
+    "package_tourism": "data/package_tourism.csv",
+}
+
+# --- Load satu tabel langsung dari CSV
+@st.cache_data
+def load_table(name):
+    """Load satu tabel dari CSV, di-cache per tabel"""
+    return pd.read_csv(TABLE_FILES[name])
+
+def require_tables(*names):
+    """Load tabel yang dibutuhkan halaman; None (dengan pesan error) jika gagal atau kosong"""
+    try:
+        frames = [load_table(name) for name in names]
+    except Exception as e:
+        st.error(f"❌ Error loading CSV files: {e}")
+        st.error(f"""
+        🔧 **Troubleshooting:**
+        1. Pastikan file CSV ada di folder 'data/'
+        2. File yang diperlukan: {', '.join(os.path.basename(TABLE_FILES[name]) for name in names)}
+        3. Pastikan struktur folder benar
+        """)
+        return None
+
+    # Cek jika ada DataFrame yang kosong
+    for name, df in zip(names, frames):
+        if df.empty:
+            st.error(f"File '{os.path.basename(TABLE_FILES[name])}' kosong atau tidak terbaca!")
+            return None
+    return frames
@@ -0,0 +1,154 @@
+import json
+import os
+import shutil
+import time
+from urllib.parse import quote
+
+import pandas as pd
+
+# --- Lokasi default dataset terpartisi (ditulis oleh etl.py, dibaca oleh app.py)
+PARTITION_DIR = "data/partitioned"
+MANIFEST_FILE = "manifest.json"
+PARTITION_COLS = ["City", "Category"]
+# Versi lama yang masih disimpan setelah rebuild, untuk pembaca yang masih memegang manifest lama
+KEEP_OLD_VERSIONS = 1
+
+
+def _partition_path(values):
+    """Path relatif hive-style, misal City=Jakarta/Category=Taman%20Hiburan"""
+    return "/".join(f"{col}={quote(str(val), safe='')}" for col, val in values.items())
+
+
+def _column_stats(df):
+    """Min/max per kolom numerik untuk statistik partisi di manifest"""
+    stats = {}
+    for col in df.select_dtypes(include="number").columns:
+        series = df[col].dropna()
+        if series.empty:
+            continue
+        low, high = series.min(), series.max()
+        stats[col] = {"min": getattr(low, "item", lambda: low)(),
+                      "max": getattr(high, "item", lambda: high)()}
+    return stats
+
+
+def write_partitioned(df, table, root=PARTITION_DIR, partition_cols=PARTITION_COLS):
+    """Tulis DataFrame sebagai dataset Parquet terpartisi dan perbarui manifest.
+
+    Kolom partisi tidak disimpan di file Parquet (nilainya ada di path dan
+    manifest), sehingga setiap file hanya berisi baris untuk satu kombinasi
+    City/Category. Setiap rebuild ditulis ke direktori versi baru dan baru
+    dipakai setelah manifest diganti secara atomik, jadi pembaca tidak pernah
+    melihat dataset setengah jadi. Mengembalikan entri manifest untuk tabel tersebut.
+    """
+    version = str(time.time_ns())
+    data_dir = f"{table}/v{version}"
+    table_dir = os.path.join(root, data_dir)
+
+    partitions = []
+    for keys, part_df in df.groupby(partition_cols, sort=True, dropna=True):
+        if not isinstance(keys, tuple):
+            keys = (keys,)
+        values = dict(zip(partition_cols, keys))
+        rel_path = f"{_partition_path(values)}/part-0.parquet"
+        file_path = os.path.join(table_dir, rel_path)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        data = part_df.drop(columns=partition_cols)
+        data.to_parquet(file_path, index=False)
+        partitions.append({
+            "path": rel_path,
+            "values": values,
+            "rows": len(data),
+            "stats": _column_stats(data),
+        })
+
+    entry = {
+        "version": version,
+        "dir": data_dir,
+        "partition_cols": list(partition_cols),
+        "columns": list(df.columns),
+        "rows": sum(p["rows"] for p in partitions),
+        "partitions": partitions,
+    }
+
+    manifest = read_manifest(root) or {"tables": {}}
+    manifest["tables"][table] = entry
+    os.makedirs(root, exist_ok=True)
+    tmp_path = os.path.join(root, MANIFEST_FILE + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, os.path.join(root, MANIFEST_FILE))
+    _remove_old_versions(os.path.join(root, table), keep=f"v{version}")
+    return entry
+
+
+def _remove_old_versions(table_dir, keep):
+    """Hapus direktori versi lama; KEEP_OLD_VERSIONS versi terbaru sebelum `keep` disisakan"""
+    old = sorted(
+        (name for name in os.listdir(table_dir)
+         if name.startswith("v") and name[1:].isdigit() and name != keep),
+        key=lambda name: int(name[1:]),
+    )
+    for name in old[:max(len(old) - KEEP_OLD_VERSIONS, 0)]:
+        shutil.rmtree(os.path.join(table_dir, name), ignore_errors=True)
+    # Layout lama (partisi langsung di bawah direktori tabel)
+    for name in os.listdir(table_dir):
+        if "=" in name:
+            shutil.rmtree(os.path.join(table_dir, name), ignore_errors=True)
+
+
+def read_manifest(root=PARTITION_DIR):
+    """Baca manifest; None jika dataset terpartisi belum dibuat"""
+    path = os.path.join(root, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _as_set(value):
+    if value is None:
+        return None
+    if isinstance(value, (list, tuple, set)):
+        return set(value)
+    return {value}
+
+
+def prune_partitions(entry, city=None, category=None):
+    """Pilih partisi yang cocok dengan filter; city/category boleh satu nilai atau list"""
+    wanted = {"City": _as_set(city), "Category": _as_set(category)}
+    return [
+        part for part in entry["partitions"]
+        if not any(allowed is not None and part["values"].get(col) not in allowed
+                   for col, allowed in wanted.items())
+    ]
+
+
+def partition_values(entry, col):
+    """Daftar nilai unik kolom partisi, langsung dari manifest tanpa membaca data"""
+    return sorted({part["values"][col] for part in entry["partitions"]})
+
+
+def read_partitioned(table, city=None, category=None, root=PARTITION_DIR, manifest=None):
+    """Baca hanya partisi yang cocok dengan filter City/Category.
+
+    Mengembalikan None jika manifest atau tabel tidak ada, supaya pemanggil
+    bisa fallback ke CSV.
+    """
+    manifest = manifest or read_manifest(root)
+    if manifest is None or table not in manifest["tables"]:
+        return None
+    entry = manifest["tables"][table]
+
+    frames = []
+    for part in prune_partitions(entry, city=city, category=category):
+        part_df = pd.read_parquet(os.path.join(root, entry.get("dir", table), part["path"]))
+        for col, val in part["values"].items():
+            part_df[col] = val
+        frames.append(part_df)
+
+    if not frames:
+        return pd.DataFrame(columns=entry["columns"])
+    # Kembalikan urutan kolom seperti tabel aslinya
+    return pd.concat(frames, ignore_index=True)[entry["columns"]]
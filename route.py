@@ -0,0 +1,208 @@
+from itertools import permutations
+
+import numpy as np
+import pandas as pd
+
+EARTH_RADIUS_KM = 6371.0088
+# Kecepatan rata-rata perjalanan dalam kota, untuk estimasi waktu tempuh
+AVG_SPEED_KMH = 30.0
+# Paket sampai 5 destinasi diselesaikan exact (5! = 120 urutan)
+EXACT_MAX_STOPS = 5
+
+_PERMUTATIONS = {n: np.array(list(permutations(range(n)))) for n in range(1, EXACT_MAX_STOPS + 1)}
+
+
+def normalize_name(name):
+    """Samakan penulisan nama tempat (spasi dan awalan '|' di package_tourism.csv)"""
+    return str(name).strip().lstrip("|").strip().lower()
+
+
+def haversine_matrix(lat, lon):
+    """Matriks jarak haversine (km) antar semua titik, dihitung vektor sekaligus"""
+    lat = np.radians(np.asarray(lat, dtype=float))
+    lon = np.radians(np.asarray(lon, dtype=float))
+    dlat = lat[:, None] - lat[None, :]
+    dlon = lon[:, None] - lon[None, :]
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat)[:, None] * np.cos(lat)[None, :] * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def visit_minutes(tourism_df):
+    """Lama kunjungan per tempat; Time_Minutes kosong diisi median kategorinya.
+
+    Kategori tanpa data sama sekali (misal Tempat Ibadah) memakai median semua
+    tempat. Mengembalikan (menit, mask tempat yang lama kunjungannya estimasi).
+    """
+    minutes = tourism_df['Time_Minutes']
+    estimated = minutes.isna()
+    fallback = minutes.groupby(tourism_df['Category']).transform('median')
+    overall = minutes.median()
+    filled = minutes.fillna(fallback).fillna(0.0 if pd.isna(overall) else overall)
+    return filled.to_numpy(dtype=float), estimated.to_numpy()
+
+
+def build_city_matrices(tourism_df):
+    """Matriks jarak per kota beserta metadata tempatnya.
+
+    Mengembalikan dict {City: {"place_ids", "names", "index", "minutes",
+    "minutes_estimated", "dist"}}, di mana index memetakan nama ternormalisasi
+    ke baris matriks.
+    """
+    matrices = {}
+    tourism_df = tourism_df.reset_index(drop=True)
+    minutes, estimated = visit_minutes(tourism_df)
+    for city, places in tourism_df.groupby('City', sort=True):
+        rows = places.index.to_numpy()
+        places = places.reset_index(drop=True)
+        matrices[city] = {
+            "place_ids": places['Place_Id'].to_numpy(),
+            "names": places['Place_Name'].to_numpy(),
+            "index": {normalize_name(n): i for i, n in enumerate(places['Place_Name'])},
+            "minutes": minutes[rows],
+            "minutes_estimated": estimated[rows],
+            "dist": haversine_matrix(places['Lat'], places['Long']),
+        }
+    return matrices
+
+
+def path_length(dist, order):
+    """Total jarak rute terbuka (tanpa kembali ke titik awal)"""
+    order = np.asarray(order)
+    return float(dist[order[:-1], order[1:]].sum()) if len(order) > 1 else 0.0
+
+
+def solve_exact_batch(dist, stops):
+    """Urutan optimal untuk banyak itinerary berukuran sama sekaligus.
+
+    stops berbentuk (P, n) berisi indeks baris dist; semua n! urutan dievaluasi
+    secara vektor. Mengembalikan (urutan (P, n), jarak (P,)).
+    """
+    stops = np.asarray(stops)
+    n = stops.shape[1]
+    if n == 1:
+        return stops.copy(), np.zeros(len(stops))
+    perms = _PERMUTATIONS[n]
+    sub = dist[stops[:, :, None], stops[:, None, :]]
+    costs = sub[:, perms[:, :-1], perms[:, 1:]].sum(axis=-1)
+    best = costs.argmin(axis=1)
+    rows = np.arange(len(stops))
+    return stops[rows[:, None], perms[best]], costs[rows, best]
+
+
+def solve_heuristic(dist, stops):
+    """Nearest neighbour dari setiap titik awal, lalu perbaikan 2-opt"""
+    stops = np.asarray(stops)
+    sub = dist[np.ix_(stops, stops)]
+    n = len(stops)
+
+    best_order, best_cost = None, np.inf
+    for start in range(n):
+        order = [start]
+        visited = np.zeros(n, dtype=bool)
+        visited[start] = True
+        for _ in range(n - 1):
+            row = np.where(visited, np.inf, sub[order[-1]])
+            nxt = int(row.argmin())
+            order.append(nxt)
+            visited[nxt] = True
+        cost = path_length(sub, order)
+        if cost < best_cost:
+            best_order, best_cost = order, cost
+
+    order = np.array(best_order)
+    improved = True
+    while improved:
+        improved = False
+        for i in range(-1, n - 2):
+            for j in range(i + 2, n):
+                # Balik segmen order[i+1..j]; rute terbuka, jadi sisi kiri (i = -1)
+                # atau kanan (j di akhir) boleh tidak ada
+                before = after = 0.0
+                if i >= 0:
+                    before += sub[order[i], order[i + 1]]
+                    after += sub[order[i], order[j]]
+                if j + 1 < n:
+                    before += sub[order[j], order[j + 1]]
+                    after += sub[order[i + 1], order[j + 1]]
+                if after < before - 1e-9:
+                    order[i + 1:j + 1] = order[i + 1:j + 1][::-1]
+                    improved = True
+    return stops[order], path_length(sub, order)
+
+
+def solve_route(dist, stops):
+    """Urutan kunjungan terbaik: exact untuk <= EXACT_MAX_STOPS, heuristik untuk lebih"""
+    stops = np.asarray(stops)
+    if len(stops) == 0:
+        return stops, 0.0
+    if len(stops) <= EXACT_MAX_STOPS:
+        order, cost = solve_exact_batch(dist, stops[None, :])
+        return order[0], float(cost[0])
+    return solve_heuristic(dist, stops)
+
+
+def route_summary(matrix, order, distance_km, speed_kmh=AVG_SPEED_KMH):
+    """Ringkasan jarak dan waktu untuk satu urutan kunjungan"""
+    visit_minutes = float(matrix["minutes"][order].sum())
+    travel_minutes = distance_km / speed_kmh * 60
+    return {
+        "Urutan_Kunjungan": " → ".join(matrix["names"][order]),
+        "Jarak_km": round(distance_km, 2),
+        "Waktu_Perjalanan_Menit": round(travel_minutes, 1),
+        "Waktu_Kunjungan_Menit": round(visit_minutes, 1),
+        "Total_Waktu_Menit": round(travel_minutes + visit_minutes, 1),
+        "Waktu_Kunjungan_Estimasi": int(matrix["minutes_estimated"][order].sum()),
+    }
+
+
+def solve_packages(package_df, matrices, speed_kmh=AVG_SPEED_KMH):
+    """Selesaikan urutan kunjungan semua paket dalam satu batch.
+
+    Paket dikelompokkan per kota dan jumlah destinasi, lalu tiap kelompok
+    diselesaikan dengan solve_exact_batch. Destinasi yang namanya tidak ada
+    di tourism_with_id dicatat di kolom Destinasi_Tidak_Ditemukan.
+    """
+    place_cols = [col for col in package_df.columns if col.startswith('Place_Tourism')]
+
+    groups = {}
+    info = []
+    for pkg, city, names in zip(package_df['Package'], package_df['City'],
+                                package_df[place_cols].itertuples(index=False, name=None)):
+        index = matrices.get(city, {}).get("index", {})
+        stops, missing = [], []
+        for name in names:
+            if pd.isna(name):
+                continue
+            i = index.get(normalize_name(name))
+            if i is None:
+                missing.append(str(name).strip())
+            elif i not in stops:
+                stops.append(i)
+        info.append((pkg, city, len(stops), missing))
+        if stops:
+            groups.setdefault((city, len(stops)), []).append((len(info) - 1, stops))
+
+    solved = {}
+    for (city, n), members in groups.items():
+        rows, stops = zip(*members)
+        stops = np.array(stops)
+        if n <= EXACT_MAX_STOPS:
+            orders, costs = solve_exact_batch(matrices[city]["dist"], stops)
+        else:
+            results = [solve_heuristic(matrices[city]["dist"], s) for s in stops]
+            orders, costs = [r[0] for r in results], [r[1] for r in results]
+        for row, order, cost in zip(rows, orders, costs):
+            solved[row] = route_summary(matrices[city], order, float(cost), speed_kmh)
+
+    empty = {"Urutan_Kunjungan": "", "Jarak_km": 0.0, "Waktu_Perjalanan_Menit": 0.0,
+             "Waktu_Kunjungan_Menit": 0.0, "Total_Waktu_Menit": 0.0, "Waktu_Kunjungan_Estimasi": 0}
+    records = []
+    for row, (pkg, city, n, missing) in enumerate(info):
+        records.append({
+            "Package": pkg,
+            "City": city,
+            "Jumlah_Destinasi": n,
+            **solved.get(row, empty),
+            "Destinasi_Tidak_Ditemukan": ", ".join(missing),
+        })
+    return pd.DataFrame(records)
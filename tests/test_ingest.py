@@ -0,0 +1,200 @@
+import os
+
+import pandas as pd
+import pytest
+
+from ingest import FIELDS, RatingStream, append_rating, copy_new_ratings
+
+
+@pytest.fixture
+def paths(tmp_path):
+    snapshot = tmp_path / "tourism_rating.csv"
+    snapshot.write_text("User_Id,Place_Id,Place_Ratings\n1,10,4\n2,10,2\n3,20,5")
+    return str(snapshot), str(tmp_path / "rating_events.csv")
+
+
+def stats_by_place(stream):
+    return stream.place_stats().set_index('Place_Id')
+
+
+def test_bootstrap_from_snapshot(paths):
+    stream = RatingStream(*paths)
+    stats = stats_by_place(stream)
+    assert stream.total_count == 3
+    assert stats.loc[10, 'Rating_Count'] == 2
+    assert stats.loc[10, 'Place_Ratings'] == 3.0
+    assert stats.loc[10, ['Hist_2', 'Hist_4']].tolist() == [1, 1]
+
+
+def test_poll_reads_new_events_and_waits_for_partial_line(paths):
+    snapshot, log = paths
+    stream = RatingStream(snapshot, log)
+    append_rating(4, 20, 1, path=log)
+    with open(log, "a") as f:
+        f.write("bukan,rating\n5,30,")
+    assert stream.poll() == 1
+    assert stream.skipped == 1
+
+    with open(log, "a") as f:
+        f.write("3\n")
+    assert stream.poll() == 1
+    assert stream.total_count == 5
+    assert stats_by_place(stream).loc[30, 'Hist_3'] == 1
+
+
+def test_empty_state_without_snapshot_or_events(tmp_path):
+    stream = RatingStream(str(tmp_path / "missing.csv"), str(tmp_path / "events.csv"))
+    stats = stream.place_stats()
+    assert stream.total_count == 0
+    assert stats.empty
+    assert 'Hist_5' in stats.columns
+
+
+def test_compaction_moves_log_into_snapshot(paths):
+    snapshot, log = paths
+    stream = RatingStream(snapshot, log, compact_every=2)
+    append_rating(4, 20, 1, path=log)
+    append_rating(5, 20, 3, path=log)
+    stream.poll()
+
+    assert not os.path.exists(log)
+    assert len(pd.read_csv(snapshot)) == 5
+    assert stream.total_count == 5
+
+    # Event setelah compaction (log baru) tetap terbaca
+    append_rating(6, 10, 5, path=log)
+    assert stream.poll() == 1
+    assert stream.total_count == 6
+    pd.testing.assert_frame_equal(
+        stats_by_place(stream).sort_index(),
+        stats_by_place(RatingStream(snapshot, log)).sort_index(),
+    )
+
+
+def test_compaction_by_other_process_keeps_unpolled_events(paths):
+    snapshot, log = paths
+    app = RatingStream(snapshot, log, compact_every=0)
+    append_rating(4, 20, 1, path=log)
+    app.poll()
+    append_rating(5, 20, 3, path=log)
+
+    # Misal `python ingest.py compact` saat dashboard berjalan
+    RatingStream(snapshot, log, compact_every=0).compact()
+    append_rating(6, 10, 5, path=log)
+
+    assert app.poll() == 2
+    assert app.total_count == 6
+    assert stats_by_place(app).loc[20, 'Rating_Count'] == 3
+
+    # Compaction kedua setelah log baru sempat dibaca
+    append_rating(7, 10, 4, path=log)
+    RatingStream(snapshot, log, compact_every=0).compact()
+    assert app.poll() == 1
+    assert app.total_count == 7
+    assert app.total_count == RatingStream(snapshot, log).total_count
+
+
+def test_poll_waits_while_compaction_in_progress(paths):
+    snapshot, log = paths
+    app = RatingStream(snapshot, log, compact_every=0)
+    append_rating(4, 20, 1, path=log)
+    app.poll()
+    append_rating(5, 20, 3, path=log)
+
+    # Proses lain memegang lock, sudah me-rename log tetapi belum menulis ke snapshot
+    open(log + ".lock", "w").close()
+    os.replace(log, log + ".compacting")
+    append_rating(6, 10, 5, path=log)
+    assert app.poll() == 0
+
+    with open(log + ".compacting") as f:
+        rows = [line for line in f if not line.startswith("User_Id")]
+    with open(snapshot, "a") as f:
+        f.write("\n" + "".join(rows))
+    os.remove(log + ".compacting")
+    os.remove(log + ".lock")
+
+    assert app.poll() == 2
+    assert app.total_count == 6
+
+
+def test_interrupted_compaction_is_recovered(paths):
+    snapshot, log = paths
+    with open(log + ".compacting", "w") as f:
+        f.write(",".join(FIELDS) + "\n4,20,1\n5,20,3\n")
+
+    stream = RatingStream(snapshot, log)
+    assert not os.path.exists(log + ".compacting")
+    assert stream.total_count == 5
+    assert len(pd.read_csv(snapshot)) == 5
+
+
+def test_interrupted_compaction_is_recovered_while_running(paths):
+    snapshot, log = paths
+    app = RatingStream(snapshot, log, compact_every=0)
+    append_rating(4, 20, 1, path=log)
+    app.poll()
+    append_rating(5, 20, 3, path=log)
+
+    # Compactor lain mati setelah rename dan meninggalkan lock yang sudah kedaluwarsa
+    os.replace(log, log + ".compacting")
+    open(log + ".lock", "w").close()
+    os.utime(log + ".lock", (0, 0))
+    for user_id in range(6, 11):
+        append_rating(user_id, 10, 5, path=log)
+
+    assert app.poll() == 6
+    assert not os.path.exists(log + ".compacting")
+    assert not os.path.exists(log + ".lock")
+    assert app.total_count == 10
+    assert app.total_count == RatingStream(snapshot, log).total_count
+
+    # compact() juga menyelesaikan sisa compaction lebih dulu
+    os.replace(log, log + ".compacting")
+    append_rating(11, 10, 4, path=log)
+    app.compact()
+    assert not os.path.exists(log + ".compacting")
+    assert not os.path.exists(log)
+    assert app.total_count == 11
+    assert len(pd.read_csv(snapshot)) == 11
+
+
+def test_compaction_skipped_while_other_process_holds_lock(paths):
+    snapshot, log = paths
+    stream = RatingStream(snapshot, log, compact_every=0)
+    append_rating(4, 20, 1, path=log)
+    open(log + ".lock", "w").close()
+
+    stream.compact()
+    assert os.path.exists(log)
+    assert stream.poll() == 1
+    assert stream.total_count == 4
+
+
+def test_compaction_writes_header_for_new_snapshot(tmp_path):
+    snapshot, log = str(tmp_path / "tourism_rating.csv"), str(tmp_path / "events.csv")
+    stream = RatingStream(snapshot, log, compact_every=0)
+    append_rating(1, 10, 4, path=log)
+    stream.compact()
+
+    assert list(pd.read_csv(snapshot).columns) == FIELDS
+    assert RatingStream(snapshot, log).total_count == 1
+
+
+def test_copy_new_ratings_resumes_from_saved_offset(tmp_path):
+    source, log = tmp_path / "source.csv", str(tmp_path / "events.csv")
+    offset_path = str(source) + ".offset"
+    source.write_text("User_Id,Place_Id,Place_Ratings\n1,10,4\n2,10,5\n")
+
+    assert copy_new_ratings(str(source), offset_path, log) == 2
+    # Restart tail: baris lama tidak disalin ulang
+    assert copy_new_ratings(str(source), offset_path, log) == 0
+
+    with open(source, "a") as f:
+        f.write("3,20,1\n4,20,")
+    assert copy_new_ratings(str(source), offset_path, log) == 1
+
+    # File sumber dibuat ulang (lebih kecil dari offset): mulai dari awal
+    source.write_text("5,30,2\n")
+    assert copy_new_ratings(str(source), offset_path, log) == 1
+    assert len(pd.read_csv(log)) == 4
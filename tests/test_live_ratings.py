@@ -0,0 +1,25 @@
+from ingest import RatingStream, append_rating
+from loaders.ratings import _has_unseen, _mark_seen
+
+
+def test_every_session_sees_events_polled_by_another(tmp_path):
+    snapshot, log = tmp_path / "tourism_rating.csv", str(tmp_path / "events.csv")
+    snapshot.write_text("User_Id,Place_Id,Place_Ratings\n1,10,4\n")
+    stream = RatingStream(str(snapshot), log, compact_every=0)
+    # Dua sesi browser memakai stream yang sama (st.cache_resource)
+    session_a, session_b = {}, {}
+    assert not _has_unseen(session_a, stream)
+    assert not _has_unseen(session_b, stream)
+
+    append_rating(2, 10, 5, path=log)
+    # Render halaman di sesi A sudah mengonsumsi event lewat poll()
+    stream.poll()
+    assert _has_unseen(session_a, stream)
+    assert _has_unseen(session_b, stream)
+
+    # Setelah rerun, masing-masing sesi menandai total yang sudah ditampilkan
+    _mark_seen(session_a, stream.total_count)
+    assert not _has_unseen(session_a, stream)
+    assert _has_unseen(session_b, stream)
+    _mark_seen(session_b, stream.total_count)
+    assert not _has_unseen(session_b, stream)
@@ -0,0 +1,78 @@
+import os
+
+import pandas as pd
+import pytest
+
+from partition import read_manifest, read_partitioned, write_partitioned
+
+
+@pytest.fixture
+def places():
+    return pd.DataFrame({
+        'Place_Id': [1, 2, 3, 4, 5],
+        'Place_Name': ["Monas", "Ancol", "Kawah Putih", "Braga", "Tugu"],
+        'Category': ["Budaya", "Taman Hiburan", "Cagar Alam", "Taman Hiburan", "Budaya"],
+        'City': ["Jakarta", "Jakarta", "Bandung", "Bandung", "Yogyakarta"],
+        'Price': [0, 25000, 50000, 0, 0],
+        'Rating': [4.6, 4.5, 4.4, 4.3, 4.7],
+        'Time_Minutes': [60.0, None, 90.0, None, 30.0],
+    })
+
+
+def test_round_trip_keeps_columns_dtypes_and_rows(tmp_path, places):
+    entry = write_partitioned(places, "places", root=str(tmp_path))
+    df = read_partitioned("places", root=str(tmp_path))
+
+    assert entry["rows"] == len(places)
+    assert list(df.columns) == list(places.columns)
+    assert df.dtypes.equals(places.dtypes)
+    expected = places.sort_values('Place_Id').reset_index(drop=True)
+    pd.testing.assert_frame_equal(df.sort_values('Place_Id').reset_index(drop=True), expected)
+
+
+def test_filter_reads_only_matching_partitions(tmp_path, places):
+    write_partitioned(places, "places", root=str(tmp_path))
+
+    df = read_partitioned("places", city="Jakarta", root=str(tmp_path))
+    assert sorted(df['Place_Id']) == [1, 2]
+    assert set(df['City']) == {"Jakarta"}
+
+    df = read_partitioned("places", category="Taman Hiburan", root=str(tmp_path))
+    assert sorted(df['Place_Id']) == [2, 4]
+
+    df = read_partitioned("places", city="Bandung", category="Taman Hiburan", root=str(tmp_path))
+    assert df['Place_Id'].tolist() == [4]
+
+
+def test_partition_paths_quote_spaces(tmp_path, places):
+    entry = write_partitioned(places, "places", root=str(tmp_path))
+    paths = [part["path"] for part in entry["partitions"]]
+
+    assert "City=Jakarta/Category=Taman%20Hiburan/part-0.parquet" in paths
+    assert all(" " not in path for path in paths)
+    assert all(os.path.exists(os.path.join(tmp_path, entry["dir"], path)) for path in paths)
+
+
+def test_unknown_city_returns_empty_frame_with_columns(tmp_path, places):
+    write_partitioned(places, "places", root=str(tmp_path))
+    df = read_partitioned("places", city="Surabaya", root=str(tmp_path))
+
+    assert df.empty
+    assert list(df.columns) == list(places.columns)
+
+
+def test_missing_manifest_returns_none(tmp_path):
+    assert read_manifest(str(tmp_path)) is None
+    assert read_partitioned("places", root=str(tmp_path)) is None
+
+
+def test_rebuild_switches_version_and_keeps_previous(tmp_path, places):
+    first = write_partitioned(places, "places", root=str(tmp_path))
+    second = write_partitioned(places.iloc[:2], "places", root=str(tmp_path))
+    third = write_partitioned(places.iloc[:3], "places", root=str(tmp_path))
+
+    assert read_manifest(str(tmp_path))["tables"]["places"]["version"] == third["version"]
+    assert len(read_partitioned("places", root=str(tmp_path))) == 3
+    # Pembaca yang masih memegang manifest sebelumnya tetap bisa membaca datanya
+    assert os.path.isdir(os.path.join(tmp_path, second["dir"]))
+    assert not os.path.exists(os.path.join(tmp_path, first["dir"]))
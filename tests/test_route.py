@@ -0,0 +1,92 @@
+from itertools import permutations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from route import (build_city_matrices, path_length, solve_exact_batch, solve_heuristic,
+                   solve_packages)
+
+
+def random_dist(rng, n):
+    points = rng.random((n, 2)) * 10
+    return np.linalg.norm(points[:, None] - points[None, :], axis=-1)
+
+
+def brute_force(dist, stops):
+    return min(path_length(dist, order) for order in permutations(stops))
+
+
+def nearest_neighbour_cost(dist, stops):
+    sub = dist[np.ix_(stops, stops)]
+    best = np.inf
+    for start in range(len(stops)):
+        order, left = [start], set(range(len(stops))) - {start}
+        while left:
+            nxt = min(left, key=lambda j: sub[order[-1], j])
+            order.append(nxt)
+            left.remove(nxt)
+        best = min(best, path_length(sub, order))
+    return best
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 4, 5])
+def test_solve_exact_batch_matches_brute_force(n):
+    rng = np.random.default_rng(n)
+    dist = random_dist(rng, 9)
+    stops = np.array([rng.choice(9, n, replace=False) for _ in range(4)])
+
+    orders, costs = solve_exact_batch(dist, stops)
+    for row, order, cost in zip(stops, orders, costs):
+        assert sorted(order) == sorted(row)
+        assert cost == pytest.approx(path_length(dist, order))
+        assert cost == pytest.approx(brute_force(dist, row))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_solve_heuristic_returns_permutation_no_longer_than_nearest_neighbour(seed):
+    rng = np.random.default_rng(seed)
+    dist = random_dist(rng, 15)
+    stops = rng.choice(15, 9, replace=False)
+
+    order, cost = solve_heuristic(dist, stops)
+    assert sorted(order) == sorted(stops)
+    assert cost == pytest.approx(path_length(dist, order))
+    assert cost <= nearest_neighbour_cost(dist, stops) + 1e-9
+
+
+def test_solve_packages_normalizes_names_and_reports_missing():
+    tourism = pd.DataFrame({
+        'Place_Id': [1, 2, 3],
+        'Place_Name': ["Monas", "Kota Tua", "Ancol"],
+        'City': ["Jakarta"] * 3,
+        'Category': ["Budaya", "Budaya", "Bahari"],
+        'Time_Minutes': [60.0, None, 90.0],
+        'Lat': [-6.175, -6.135, -6.125],
+        'Long': [106.827, 106.813, 106.836],
+    })
+    packages = pd.DataFrame({
+        'Package': [1, 2, 3],
+        'City': ["Jakarta", "Jakarta", "Bandung"],
+        'Place_Tourism1': ["  |Monas", "Ancol", "Monas"],
+        'Place_Tourism2': ["kota tua ", "ancol", None],
+        'Place_Tourism3': ["Ragunan", "|ANCOL", None],
+    })
+
+    plan = solve_packages(packages, build_city_matrices(tourism)).set_index('Package')
+    assert plan.loc[1, 'Jumlah_Destinasi'] == 2
+    assert set(plan.loc[1, 'Urutan_Kunjungan'].split(" → ")) == {"Monas", "Kota Tua"}
+    assert plan.loc[1, 'Destinasi_Tidak_Ditemukan'] == "Ragunan"
+    # Kota Tua tanpa Time_Minutes memakai median kategori Budaya
+    assert plan.loc[1, 'Waktu_Kunjungan_Menit'] == 120.0
+    assert plan.loc[1, 'Waktu_Kunjungan_Estimasi'] == 1
+
+    # Destinasi ganda hanya dikunjungi sekali
+    assert plan.loc[2, 'Jumlah_Destinasi'] == 1
+    assert plan.loc[2, 'Jarak_km'] == 0.0
+    assert plan.loc[2, 'Destinasi_Tidak_Ditemukan'] == ""
+
+    # Kota tanpa tempat wisata: semua destinasi tidak ditemukan
+    assert plan.loc[3, 'Jumlah_Destinasi'] == 0
+    assert plan.loc[3, 'Urutan_Kunjungan'] == ""
+    assert plan.loc[3, 'Destinasi_Tidak_Ditemukan'] == "Monas"
@@ -0,0 +1,141 @@
+import streamlit as st
+
+# --- Custom CSS untuk tampilan yang clean
+APP_CSS = """
+<style>
+    /* Main background */
+    .main {
+        background-color: #f8f9fa;
+    }
+    
+    /* Sidebar styling */
+    [data-testid="stSidebar"] {
+        background: linear-gradient(180deg, #2E8BC0 0%, #145DA0 100%);
+    }
+    
+    /* Card styling untuk metrics */
+    .metric-card {
+        background: white;
+        padding: 20px;
+        border-radius: 10px;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+        border-left: 4px solid #2E8BC0;
+        margin-bottom: 10px;
+    }
+    
+    /* Title styling */
+    .main-title {
+        color: #145DA0;
+        font-size: 2.5rem;
+        font-weight: 700;
+        margin-bottom: 1rem;
+    }
+    
+    .section-title {
+        color: #2E8BC0;
+        font-size: 1.5rem;
+        font-weight: 600;
+        margin: 2rem 0 1rem 0;
+        padding-bottom: 0.5rem;
+        border-bottom: 2px solid #e9ecef;
+    }
+    
+    /* Button styling */
+    .stButton button {
+        background: linear-gradient(45deg, #2E8BC0, #145DA0);
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 10px 20px;
+        font-weight: 500;
+    }
+    
+    .stButton button:hover {
+        background: linear-gradient(45deg, #145DA0, #0C2D48);
+        color: white;
+    }
+    
+    /* SELECTBOX FIX - PERBAIKAN UTAMA */
+    .stSelectbox > div > div {
+        border-radius: 8px !important;
+        border: 2px solid #e9ecef !important;
+        padding: 4px 8px !important;
+        min-height: 40px !important;
+    }
+    
+    .stSelectbox > div > div:hover {
+        border-color: #2E8BC0 !important;
+    }
+    
+    .stSelectbox > div > div[data-baseweb="select"] > div {
+        border-radius: 8px !important;
+    }
+    
+    /* Dropdown menu styling */
+    div[role="listbox"] {
+        border-radius: 8px !important;
+        border: 2px solid #e9ecef !important;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1) !important;
+        max-height: 300px !important;
+        overflow-y: auto !important;
+    }
+    
+    div[role="listbox"] > div {
+        padding: 10px 15px !important;
+        border-bottom: 1px solid #f1f3f4 !important;
+    }
+    
+    div[role="listbox"] > div:hover {
+        background-color: #f8f9fa !important;
+    }
+    
+    div[role="listbox"] > div[aria-selected="true"] {
+        background-color: #2E8BC0 !important;
+        color: white !important;
+    }
+    
+    /* Dataframe styling */
+    .dataframe {
+        border-radius: 10px;
+        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
+    }
+    
+    /* Radio button styling */
+    div[role="radiogroup"] > label {
+        background-color: rgba(255,255,255,0.1) !important;
+        border-radius: 10px !important;
+        padding: 8px 12px !important;
+        margin: 5px 0px !important;
+        transition: all 0.3s ease-in-out !important;
+        font-weight: 500 !important;
+        border: 1px solid rgba(255,255,255,0.2) !important;
+    }
+    
+    div[role="radiogroup"] > label:hover {
+        background-color: rgba(255,255,255,0.25) !important;
+        transform: scale(1.03) !important;
+    }
+    
+    div[role="radiogroup"] > label[data-checked="true"] {
+        background-color: #00A8E8 !important;
+        color: white !important;
+        font-weight: bold !important;
+        border: 1px solid #00A8E8 !important;
+    }
+</style>
+"""
+
+def inject_css():
+    st.markdown(APP_CSS, unsafe_allow_html=True)
+
+# --- Function untuk membuat metric card
+def metric_card(title, value, delta=None, delta_color="normal"):
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div style="font-size: 0.9rem; color: #6c757d; margin-bottom: 5px;">{title}</div>
+            <div style="font-size: 1.8rem; font-weight: 700; color: #145DA0;">{value}</div>
+            {f'<div style="font-size: 0.8rem; color: {"green" if delta_color == "normal" else "red"};">{delta}</div>' if delta else ''}
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,19 @@
+import importlib
+
+# --- Registry halaman: label navigasi -> modul halaman.
+# Modul (beserta import berat dan datanya) baru di-load saat halaman pertama kali dipilih.
+PAGES = {
+    "🏠 Dashboard Utama": "views.dashboard",
+    "⭐ Analisis Rating": "views.rating",
+    "🏙️ Analisis Wisata": "views.wisata",
+    "💼 Analisis Paket": "views.paket",
+    "🌟 Rekomendasi": "views.rekomendasi",
+    "🗃️ Data Viewer": "views.viewer",
+}
+
+def load_page(label):
+    """Import modul halaman (sekali per proses, lalu diambil dari sys.modules)"""
+    return importlib.import_module(PAGES[label])
+
+def render_page(label):
+    load_page(label).render()
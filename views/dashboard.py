@@ -0,0 +1,127 @@
+import plotly.express as px
+import streamlit as st
+
+from binning import OTHER_LABEL, top_n_with_other
+from loaders.ratings import get_rating_stream, live_rating_status, load_rating_distributions
+from loaders.tables import require_tables
+from ui import metric_card
+
+def render():
+    """Dashboard utama: ringkasan data dan visualisasi umum"""
+    tables = require_tables("tourism_with_id", "users", "package_tourism")
+    if tables is None:
+        return
+    tourism_df, user_df, package_df = tables
+
+    with st.sidebar:
+        live_rating_status()
+
+    st.markdown('<div class="main-title">📊 Tourism Analytics Dashboard</div>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div style="background: linear-gradient(45deg, #2E8BC0, #145DA0); color: white; padding: 20px; border-radius: 10px; margin-bottom: 20px;">
+        <h3 style="margin: 0; font-size: 1.2rem;">Selamat Datang di Dashboard Pariwisata</h3>
+        <p style="margin: 5px 0 0 0; opacity: 0.9;">Analisis komprehensif data tempat wisata, rating, dan paket perjalanan</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Metrics dalam grid yang rapi
+    st.markdown('<div class="section-title">📈 Overview Data</div>', unsafe_allow_html=True)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        metric_card("Total Tempat Wisata", len(tourism_df))
+    with col2:
+        metric_card("Total Pengguna", len(user_df))
+    with col3:
+        metric_card("Total Paket Wisata", len(package_df))
+    with col4:
+        metric_card("Total Rating", get_rating_stream().total_count)
+    
+    # Visualisasi dalam tabs
+    st.markdown('<div class="section-title">📊 Visualisasi Data</div>', unsafe_allow_html=True)
+    
+    tab1, tab2, tab3 = st.tabs(["🏞️ Distribusi Kategori", "🏙️ Wisata per Kota", "📈 Analisis Rating"])
+    
+    with tab1:
+        if 'Category' in tourism_df.columns:
+            col1, col2 = st.columns([2, 1])
+            with col1:
+                category_counts = top_n_with_other(tourism_df['Category'].value_counts(), 10)
+                fig = px.bar(
+                    x=category_counts.index,
+                    y=category_counts.values,
+                    title="Jumlah Tempat Wisata per Kategori",
+                    color=category_counts.values,
+                    color_continuous_scale='Blues'
+                )
+                fig.update_layout(
+                    xaxis_title="Kategori",
+                    yaxis_title="Jumlah",
+                    showlegend=False
+                )
+                st.plotly_chart(fig, use_container_width=True)
+            
+            with col2:
+                fig_pie = px.pie(
+                    values=category_counts.values,
+                    names=category_counts.index,
+                    title="Persentase Kategori"
+                )
+                st.plotly_chart(fig_pie, use_container_width=True)
+    
+    with tab2:
+        if 'City' in tourism_df.columns:
+            city_counts = top_n_with_other(tourism_df['City'].value_counts(), 10)
+            # Judul mengikuti jumlah kota yang benar-benar digambar
+            has_other = OTHER_LABEL in city_counts.index
+            city_title = f"{len(city_counts) - has_other} Kota dengan Wisata Terbanyak"
+            if has_other:
+                city_title += f" (sisanya di '{OTHER_LABEL}')"
+            fig = px.bar(
+                x=city_counts.values,
+                y=city_counts.index,
+                orientation='h',
+                title=city_title,
+                color=city_counts.values,
+                color_continuous_scale='Viridis'
+            )
+            fig.update_layout(
+                xaxis_title="Jumlah Wisata",
+                yaxis_title="Kota"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+    
+    with tab3:
+        rating_bins, rating_values = load_rating_distributions()
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            fig = px.bar(
+                rating_bins,
+                x='bin_mid',
+                y='count',
+                hover_data=['bin_start', 'bin_end'],
+                title="Distribusi Rating Tempat Wisata",
+                color_discrete_sequence=['#2E8BC0']
+            )
+            fig.update_traces(width=rating_bins['bin_end'] - rating_bins['bin_start'])
+            fig.update_layout(
+                xaxis_title="Rating",
+                yaxis_title="Jumlah Tempat Wisata",
+                bargap=0
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with col2:
+            fig = px.bar(
+                x=rating_values.index,
+                y=rating_values.values,
+                title="Distribusi Nilai Rating Pengguna",
+                color_discrete_sequence=['#145DA0']
+            )
+            fig.update_layout(
+                xaxis_title="Nilai Rating",
+                yaxis_title="Jumlah Rating"
+            )
+            st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,133 @@
+import plotly.express as px
+import streamlit as st
+
+from binning import top_n_with_other
+from loaders.routes import load_city_matrices, load_route_plan
+from loaders.tables import require_tables
+from route import AVG_SPEED_KMH, route_summary, solve_route
+from ui import metric_card
+
+def render():
+    """Analisis paket wisata beserta rute dan estimasi waktunya"""
+    tables = require_tables("package_tourism")
+    if tables is None:
+        return
+    package_df = tables[0]
+
+    st.markdown('<div class="main-title">💼 Analisis Paket Wisata</div>', unsafe_allow_html=True)
+    
+    if 'City' in package_df.columns:
+        # Metrics
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            metric_card("Total Paket", len(package_df))
+        with col2:
+            metric_card("Kota Tersedia", package_df['City'].nunique())
+        with col3:
+            # Hitung jumlah destinasi
+            tempat_cols = [col for col in package_df.columns if any(keyword in col for keyword in ['Place', 'Tourism', 'Destinasi', 'Wisata'])]
+            if tempat_cols:
+                avg_destinations = package_df[tempat_cols].notna().sum(axis=1).mean()
+                metric_card("Rata-rata Destinasi", f"{avg_destinations:.1f}")
+
+        # Visualizations
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown('<div class="section-title">🌆 Paket per Kota</div>', unsafe_allow_html=True)
+            paket_kota = top_n_with_other(package_df['City'].value_counts(), 10)
+            fig = px.pie(
+                values=paket_kota.values,
+                names=paket_kota.index,
+                title="Distribusi Paket Wisata per Kota",
+                hole=0.4
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with col2:
+            st.markdown('<div class="section-title">🏝️ Jumlah Destinasi per Paket</div>', unsafe_allow_html=True)
+            if tempat_cols:
+                package_df['Jumlah_Destinasi'] = package_df[tempat_cols].notna().sum(axis=1)
+                dest_count = package_df['Jumlah_Destinasi'].value_counts().sort_index()
+                
+                fig = px.bar(
+                    x=dest_count.index,
+                    y=dest_count.values,
+                    title="Distribusi Jumlah Destinasi",
+                    color=dest_count.values,
+                    color_continuous_scale='Purples'
+                )
+                fig.update_layout(
+                    xaxis_title="Jumlah Destinasi",
+                    yaxis_title="Jumlah Paket"
+                )
+                st.plotly_chart(fig, use_container_width=True)
+
+        # Rute dan estimasi waktu per paket
+        st.markdown('<div class="section-title">🧭 Rute & Estimasi Waktu</div>', unsafe_allow_html=True)
+        route_plan = load_route_plan()
+        # Paket dengan destinasi tidak ditemukan hanya dirutekan sebagian; tidak ikut ringkasan
+        complete_plan = route_plan[route_plan['Destinasi_Tidak_Ditemukan'] == ""]
+        partial_packages = len(route_plan) - len(complete_plan)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            metric_card("Rata-rata Jarak", f"{complete_plan['Jarak_km'].mean():.1f} km")
+        with col2:
+            metric_card("Rata-rata Waktu Total", f"{complete_plan['Total_Waktu_Menit'].mean() / 60:.1f} jam")
+        with col3:
+            metric_card("Paket Terjauh", f"{complete_plan['Jarak_km'].max():.1f} km")
+        
+        farthest = complete_plan.nlargest(15, 'Jarak_km')
+        farthest['Paket'] = "Paket " + farthest['Package'].astype(str)
+        fig = px.bar(
+            farthest,
+            x='Paket',
+            y='Jarak_km',
+            color='City',
+            hover_data=['Urutan_Kunjungan', 'Total_Waktu_Menit'],
+            title="15 Paket dengan Rute Terjauh"
+        )
+        fig.update_layout(
+            xaxis_title="Paket",
+            yaxis_title="Jarak (km)"
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        
+        estimated_packages = int((route_plan['Waktu_Kunjungan_Estimasi'] > 0).sum())
+        st.caption(
+            "Jarak dihitung garis lurus (haversine) dengan urutan kunjungan terpendek; "
+            f"waktu perjalanan diestimasi dengan kecepatan rata-rata {AVG_SPEED_KMH:.0f} km/jam. "
+            "Lama kunjungan yang kosong di data diisi median kategori tempatnya "
+            f"(kolom Waktu_Kunjungan_Estimasi; {estimated_packages} paket memakai estimasi ini). "
+            f"{partial_packages} paket dengan destinasi tidak ditemukan hanya dirutekan sebagian "
+            "dan tidak dihitung di ringkasan maupun chart di atas."
+        )
+        st.dataframe(route_plan, use_container_width=True)
+        
+        # Itinerary kustom: exact sampai 5 destinasi, heuristik untuk lebih banyak
+        with st.expander("🗺️ Susun Rute Kustom"):
+            matrices = load_city_matrices()
+            custom_city = st.selectbox("Kota:", sorted(matrices.keys()), key="custom_route_city")
+            city_matrix = matrices[custom_city]
+            custom_places = st.multiselect(
+                "Pilih destinasi:",
+                list(range(len(city_matrix["names"]))),
+                format_func=lambda i: city_matrix["names"][i],
+                key="custom_route_places"
+            )
+            if custom_places:
+                order, distance_km = solve_route(city_matrix["dist"], custom_places)
+                summary = route_summary(city_matrix, order, distance_km)
+                st.markdown(f"**Urutan:** {summary['Urutan_Kunjungan']}")
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.metric("Total Jarak", f"{summary['Jarak_km']:.2f} km")
+                with col2:
+                    st.metric("Total Waktu", f"{summary['Total_Waktu_Menit']:.0f} menit")
+                if summary['Waktu_Kunjungan_Estimasi']:
+                    st.caption(f"{summary['Waktu_Kunjungan_Estimasi']} destinasi memakai estimasi lama kunjungan (median kategori).")
+
+        # Data table
+        st.markdown('<div class="section-title">📋 Daftar Paket Wisata</div>', unsafe_allow_html=True)
+        st.dataframe(package_df, use_container_width=True)
@@ -0,0 +1,75 @@
+import plotly.express as px
+import streamlit as st
+
+from loaders.ratings import live_rating_status, load_live_ratings
+from loaders.tables import require_tables
+from ui import metric_card
+
+def render():
+    """Analisis rating tempat wisata dari agregat rating live"""
+    tables = require_tables("tourism_with_id")
+    if tables is None:
+        return
+    tourism_df = tables[0]
+
+    with st.sidebar:
+        live_rating_status()
+
+    st.markdown('<div class="main-title">⭐ Analisis Rating Tempat Wisata</div>', unsafe_allow_html=True)
+    
+    # Hitung rata-rata rating
+    avg_rating = load_live_ratings()[['Place_Id', 'Place_Ratings']]
+    avg_rating = avg_rating.merge(tourism_df[['Place_Id', 'Place_Name', 'City', 'Category']], on='Place_Id', how='left')
+    avg_rating = avg_rating.sort_values('Place_Ratings', ascending=False)
+
+    col1, col2 = st.columns([3, 1])
+    
+    with col1:
+        # Top 10 tempat wisata
+        st.markdown('<div class="section-title">🏆 Top 10 Tempat Wisata Berdasarkan Rating</div>', unsafe_allow_html=True)
+        top10 = avg_rating.head(10)
+        
+        if not top10.empty:
+            fig = px.bar(
+                top10,
+                x='Place_Name',
+                y='Place_Ratings',
+                text='Place_Ratings',
+                color='City',
+                title="",
+                color_discrete_sequence=px.colors.qualitative.Bold
+            )
+            fig.update_traces(
+                texttemplate='%{text:.2f}', 
+                textposition='outside',
+                marker_line_color='black',
+                marker_line_width=1
+            )
+            fig.update_layout(
+                xaxis_title="Nama Tempat Wisata",
+                yaxis_title="Rating Rata-rata",
+                xaxis_tickangle=-45,
+                showlegend=True
+            )
+            st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        st.markdown('<div class="section-title">📊 Statistik</div>', unsafe_allow_html=True)
+        metric_card("Rating Tertinggi", f"{avg_rating['Place_Ratings'].max():.2f}")
+        metric_card("Rating Terendah", f"{avg_rating['Place_Ratings'].min():.2f}")
+        metric_card("Rating Rata-rata", f"{avg_rating['Place_Ratings'].mean():.2f}")
+        
+        # Filter by category
+        if 'Category' in avg_rating.columns:
+            st.markdown("**Filter by Kategori:**")
+            selected_category = st.selectbox("Pilih kategori:", ["All"] + list(avg_rating['Category'].unique()))
+            if selected_category != "All":
+                filtered_data = avg_rating[avg_rating['Category'] == selected_category]
+                st.metric(f"Rating Rata-rata ({selected_category})", f"{filtered_data['Place_Ratings'].mean():.2f}")
+
+    # Data table
+    st.markdown('<div class="section-title">📋 Data Detail</div>', unsafe_allow_html=True)
+    st.dataframe(
+        avg_rating[['Place_Name', 'City', 'Category', 'Place_Ratings']].head(20),
+        use_container_width=True
+    )
@@ -0,0 +1,90 @@
+import plotly.express as px
+import streamlit as st
+
+from loaders.places import load_place_dimensions, load_places
+from loaders.ratings import live_rating_status, load_live_ratings
+
+def render():
+    """Rekomendasi tempat wisata berdasarkan rating live"""
+    # Opsi filter dari manifest; tempat wisata hanya dibaca per partisi
+    dimensions = load_place_dimensions()
+    if dimensions is None:
+        return
+    cities, categories, _ = dimensions
+
+    with st.sidebar:
+        live_rating_status()
+
+    st.markdown('<div class="main-title">🌟 Rekomendasi Tempat Wisata Terbaik</div>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        st.markdown('<div class="section-title">🎯 Pilihan Kategori</div>', unsafe_allow_html=True)
+        pilih_kategori = st.selectbox(
+            "Pilih kategori wisata:",
+            categories
+        )
+        
+        # Additional filters
+        selected_city = st.selectbox(
+            "Filter by Kota:",
+            ["All Cities"] + cities
+        )
+        
+        st.markdown("""
+        <div style="background: #e8f4f8; padding: 15px; border-radius: 8px; border-left: 4px solid #2E8BC0;">
+            <h4 style="margin: 0 0 10px 0; color: #145DA0;">💡 Tips</h4>
+            <p style="margin: 0; font-size: 0.9rem; color: #555;">
+            Rekomendasi berdasarkan rating tertinggi dari pengguna. Pilih kategori untuk melihat tempat terbaik.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        # Get recommendations: rating live + partisi tempat kategori (dan kota) terpilih
+        city_filter = None if selected_city == "All Cities" else selected_city
+        top_wisata = (
+            load_live_ratings()[['Place_Id', 'Place_Ratings']]
+            .merge(load_places(city_filter, pilih_kategori), on='Place_Id')
+        )
+        
+        top_wisata = top_wisata.sort_values('Place_Ratings', ascending=False).head(10)
+
+        if not top_wisata.empty:
+            st.markdown(f'<div class="section-title">🏅 Top 5 {pilih_kategori}</div>', unsafe_allow_html=True)
+            
+            # Display as cards
+            for idx, row in top_wisata.head(5).iterrows():
+                with st.container():
+                    st.markdown(f"""
+                    <div style="background: white; padding: 15px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); margin: 10px 0; border-left: 4px solid #2E8BC0;">
+                        <div style="display: flex; justify-content: between; align-items: center;">
+                            <h4 style="margin: 0; color: #145DA0;">{row['Place_Name']}</h4>
+                            <span style="background: #2E8BC0; color: white; padding: 5px 10px; border-radius: 15px; font-size: 0.8rem;">
+                                ⭐ {row['Place_Ratings']:.2f}
+                            </span>
+                        </div>
+                        <p style="margin: 5px 0; color: #666; font-size: 0.9rem;">
+                            <strong>Kota:</strong> {row['City']} | <strong>Kategori:</strong> {row['Category']}
+                        </p>
+                    </div>
+                    """, unsafe_allow_html=True)
+            
+            # Chart for the top recommendations
+            fig = px.bar(
+                top_wisata.head(5),
+                x='Place_Name',
+                y='Place_Ratings',
+                color='Place_Ratings',
+                color_continuous_scale='Viridis',
+                title=f"Top 5 {pilih_kategori} Berdasarkan Rating"
+            )
+            fig.update_layout(
+                xaxis_title="Tempat Wisata",
+                yaxis_title="Rating"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+            
+        else:
+            st.warning(f"Tidak ada data untuk kategori {pilih_kategori}")
@@ -0,0 +1,46 @@
+import streamlit as st
+
+from loaders.tables import require_tables
+
+def render():
+    """Viewer data mentah; hanya tabel yang dipilih yang di-load"""
+    st.markdown('<div class="main-title">🗃️ Data Warehouse Viewer</div>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([1, 3])
+    
+    with col1:
+        st.markdown('<div class="section-title">📂 Pilih Tabel</div>', unsafe_allow_html=True)
+        pilihan = st.selectbox(
+            "Pilih tabel yang ingin ditampilkan:",
+            ["tourism_with_id", "tourism_rating", "users", "package_tourism"]
+        )
+        
+        st.markdown("""
+        <div style="background: #fff3cd; padding: 15px; border-radius: 8px; border-left: 4px solid #ffc107;">
+            <h4 style="margin: 0 0 10px 0; color: #856404;">ℹ️ Informasi</h4>
+            <p style="margin: 0; font-size: 0.9rem; color: #856404;">
+            Tampilkan data mentah dari warehouse untuk analisis detail.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        # Hanya tabel yang dipilih yang di-load
+        tables = require_tables(pilihan)
+        if tables is None:
+            return
+        selected_df = tables[0]
+        
+        st.markdown(f'<div class="section-title">📊 Tabel: {pilihan}</div>', unsafe_allow_html=True)
+        st.write(f"**Jumlah Record:** {len(selected_df)}")
+        
+        # Search functionality
+        search_term = st.text_input("🔍 Cari data...")
+        if search_term:
+            # Search in all string columns
+            mask = selected_df.astype(str).apply(lambda x: x.str.contains(search_term, case=False, na=False)).any(axis=1)
+            filtered_df = selected_df[mask]
+            st.write(f"**Hasil pencarian:** {len(filtered_df)} record ditemukan")
+            st.dataframe(filtered_df, use_container_width=True)
+        else:
+            st.dataframe(selected_df, use_container_width=True)
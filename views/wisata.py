@@ -0,0 +1,78 @@
+import plotly.express as px
+import streamlit as st
+
+from binning import top_n_with_other
+from loaders.places import count_places, load_place_dimensions, load_places
+
+def render():
+    """Analisis tempat wisata per kota dan kategori"""
+    # Opsi filter dan jumlah per kota dari manifest; data hanya dibaca per partisi
+    dimensions = load_place_dimensions()
+    if dimensions is None:
+        return
+    cities, categories, city_counts = dimensions
+
+    st.markdown('<div class="main-title">🏙️ Analisis Tempat Wisata</div>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown('<div class="section-title">🏘️ Distribusi Wisata per Kota</div>', unsafe_allow_html=True)
+        wisata_per_kota = top_n_with_other(city_counts, 15).reset_index()
+        wisata_per_kota.columns = ['City', 'Jumlah_Wisata']
+
+        fig = px.bar(
+            wisata_per_kota,
+            x='City',
+            y='Jumlah_Wisata',
+            text='Jumlah_Wisata',
+            color='Jumlah_Wisata',
+            color_continuous_scale='Teal'
+        )
+        fig.update_traces(textposition='outside')
+        fig.update_layout(
+            xaxis_title="Kota",
+            yaxis_title="Jumlah Tempat Wisata",
+            showlegend=False
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        st.markdown('<div class="section-title">🎯 Filter Data</div>', unsafe_allow_html=True)
+        
+        # Filter by category
+        selected_category = st.selectbox(
+            "Pilih Kategori:",
+            ["All Categories"] + categories
+        )
+        category_filter = None if selected_category == "All Categories" else selected_category
+        
+        if category_filter is not None:
+            st.metric(f"Jumlah {selected_category}", count_places(category=category_filter))
+        
+        # Filter by city
+        city_filter = None
+        selected_city = st.selectbox(
+            "Pilih Kota:",
+            ["All Cities"] + cities
+        )
+        
+        if selected_city != "All Cities":
+            city_filter = selected_city
+            st.metric(f"Jumlah di {selected_city}", count_places(city_filter, category_filter))
+        
+        # Hanya partisi yang cocok dengan filter yang dibaca
+        filtered_df = load_places(city_filter, category_filter)
+
+    # Filtered data table
+    st.markdown('<div class="section-title">📊 Data Tempat Wisata</div>', unsafe_allow_html=True)
+    display_columns = ['Place_Id', 'Place_Name', 'City', 'Category']
+    # Add other available columns
+    for col in ['Price', 'Rating', 'Description']:
+        if col in filtered_df.columns:
+            display_columns.append(col)
+    
+    st.dataframe(
+        filtered_df[display_columns].head(50),
+        use_container_width=True
+    )